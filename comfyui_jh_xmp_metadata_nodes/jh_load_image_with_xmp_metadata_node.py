@@ -1,17 +1,22 @@
+from __future__ import annotations
+
 import hashlib
 import os
 from collections import namedtuple
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import folder_paths
-import numpy as np
 import PIL.Image
 import PIL.ImageOps
 import PIL.ImageSequence
-import torch
 
 from .jh_xmp_metadata import JHXMPMetadata
 
+if TYPE_CHECKING:
+    # torch and numpy are imported inside the methods that need them so that
+    # importing this module (and the package entry point) stays cheap.
+    import torch
+
 JHLoadImageWithXMPMetadataResultTuple = namedtuple(
     "ResultTuple",
     [
@@ -128,6 +133,8 @@ class JHLoadImageWithXMPMetadataNode:
             output_masks.append(mask_tensor.unsqueeze(0))
 
         # Combine frames into a single tensor if multiple frames exist
+        import torch
+
         if len(output_images) > 1 and image_object.format not in excluded_formats:
             output_image = torch.cat(output_images, dim=0)
             output_mask = torch.cat(output_masks, dim=0)
@@ -153,6 +160,9 @@ class JHLoadImageWithXMPMetadataNode:
     def _frame_to_tensors(
         self, raw_frame: PIL.Image.Image
     ) -> tuple[torch.Tensor, torch.Tensor]:
+        import numpy as np
+        import torch
+
         # Fix image orientation based on EXIF metadata. Do this in
         # place to avoid creating a new image object for each frame.
         PIL.ImageOps.exif_transpose(raw_frame, in_place=True)
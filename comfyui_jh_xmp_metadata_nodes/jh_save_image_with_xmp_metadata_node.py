@@ -9,20 +9,24 @@ Classes:
     JHSaveImageWithXMPMetadataNode: Handles saving images with metadata.
 """
 
+import functools
 import json
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import folder_paths  # pyright: ignore[reportMissingImports]
-import numpy as np
 import PIL.Image
-import torch
 from PIL.Image import Image
 from PIL.PngImagePlugin import PngInfo
 
 from .jh_xmp_metadata import JHXMPMetadata
 
+if TYPE_CHECKING:
+    # torch is only referenced in type annotations; deferring the import
+    # keeps this module cheap to load outside the ComfyUI runtime.
+    import torch
+
 
 class JHSupportedImageTypes(StrEnum):
     """
@@ -74,10 +78,14 @@ class JHSaveImageWithXMPMetadataNode:
         self.compress_level: int = 0
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def INPUT_TYPES(cls) -> dict[str, Any]:  # pylint: disable=invalid-name
         """
         Define the input types and their configuration for the node.
 
+        The schema is pure data, so the result is memoized and every caller
+        shares the same dictionary.
+
         Returns:
             dict: A dictionary of required, optional, and hidden input types.
         """
@@ -252,26 +260,40 @@ class JHSaveImageWithXMPMetadataNode:
         batch_number: int = 0
         image: torch.Tensor
 
+        # When every metadata field is a scalar the XMP document is identical
+        # for each image in the batch, so build it once up front rather than
+        # constructing a fresh element tree per image.
+        fields = (
+            creator,
+            rights,
+            title,
+            description,
+            subject,
+            instructions,
+            comment,
+            alt_text,
+            ext_description,
+        )
+        shared_xmp: str | None = None
+        if not any(isinstance(field, list) for field in fields):
+            shared_xmp = self.xmp(*fields, xml_string, 0)
+
         for batch_number, image in enumerate(images):
-            i: np.ndarray = 255.0 * image.cpu().numpy()
-            img: Image = PIL.Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
+            # Scale and clamp on the tensor so NumPy never materializes a
+            # float intermediate; .numpy() on the uint8 tensor is itself
+            # zero-copy.
+            img: Image = PIL.Image.fromarray(
+                image.cpu().mul(255).clamp(0, 255).byte().numpy()
+            )
             filename_with_batch_num: str = filename.replace(
                 "%batch_num%", str(batch_number)
             )
             file: str = f"{filename_with_batch_num}_{counter:05}_.{filename_extension}"
 
-            xmp = self.xmp(
-                creator,
-                rights,
-                title,
-                description,
-                subject,
-                instructions,
-                comment,
-                alt_text,
-                ext_description,
-                xml_string,
-                batch_number,
+            xmp = (
+                shared_xmp
+                if shared_xmp is not None
+                else self.xmp(*fields, xml_string, batch_number)
             )
 
             self.save_image(
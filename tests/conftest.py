@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from comfyui_jh_xmp_metadata_nodes.jh_save_image_with_xmp_metadata_node import (
+    JHSaveImageWithXMPMetadataNode,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_folder_paths(
+    module_mocker: MockerFixture,
+) -> dict[str, MagicMock | AsyncMock]:
+    mock_get_output_dir = module_mocker.patch(
+        "folder_paths.get_output_directory", return_value="/mock/output/dir"
+    )
+    mock_get_save_path = module_mocker.patch(
+        "folder_paths.get_save_image_path",
+        return_value=(
+            "/mock/output/dir",
+            "mock_filename",
+            0,
+            "mock_subfolder",
+            "mock_filename_prefix",
+        ),
+    )
+
+    # Return a dictionary of mocks so you can access them in tests
+    return {
+        "get_output_directory": mock_get_output_dir,
+        "get_save_image_path": mock_get_save_path,
+    }
+
+
+@pytest.fixture(scope="module")
+def node(
+    mock_folder_paths: dict[str, MagicMock | AsyncMock],
+) -> JHSaveImageWithXMPMetadataNode:
+    return JHSaveImageWithXMPMetadataNode()
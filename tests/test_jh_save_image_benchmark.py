@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from comfyui_jh_xmp_metadata_nodes.jh_save_image_with_xmp_metadata_node import (
+    JHSaveImageWithXMPMetadataNode,
+    JHSupportedImageTypes,
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+_XMP = "<xmpmeta>Test XML</xmpmeta>"
+
+
+@pytest.fixture(autouse=True)
+def _benchmark_only(request: pytest.FixtureRequest) -> None:
+    # Keep ordinary CI runs unaffected; the encode benchmarks are opt-in.
+    if not request.config.getoption("--benchmark-only"):
+        pytest.skip("encode benchmarks run only with --benchmark-only")
+
+
+@pytest.fixture(scope="module")
+def bench_pil_image() -> "Image.Image":
+    np = pytest.importorskip("numpy")
+    pil_image = pytest.importorskip("PIL.Image")
+
+    rng = np.random.default_rng(seed=0)
+    return pil_image.fromarray(
+        rng.integers(0, 256, (512, 512, 3), dtype=np.uint8), "RGB"
+    )
+
+
+@pytest.mark.benchmark(group="encode")
+@pytest.mark.parametrize("image_type", list(JHSupportedImageTypes))
+def test_encode_perf(
+    benchmark,  # noqa: ANN001
+    node: JHSaveImageWithXMPMetadataNode,
+    bench_pil_image: "Image.Image",
+    tmp_path: Path,
+    image_type: JHSupportedImageTypes,
+) -> None:
+    # Tracks the real encoder cost per format so regressions (e.g. a PNG
+    # compression-level change) show up instead of hiding behind the
+    # suffix-only functional tests.
+    to_path = tmp_path / f"bench.{node.extension_for_type(image_type)}"
+    benchmark(node.save_image, bench_pil_image, image_type, to_path, _XMP)
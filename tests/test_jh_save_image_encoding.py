@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import torch
+    from pytest_mock import MockerFixture
+
+from comfyui_jh_xmp_metadata_nodes.jh_save_image_with_xmp_metadata_node import (
+    JHSaveImageWithXMPMetadataNode,
+    JHSupportedImageTypes,
+)
+
+_XMP = "<xmpmeta>Test XML</xmpmeta>"
+
+
+@pytest.fixture(scope="module")
+def mock_image() -> torch.Tensor:
+    # Imported lazily so collecting (or deselecting) this module does not pay
+    # the torch import cost.
+    torch = pytest.importorskip("torch")
+
+    # Generate a random uint8 tensor directly; the tests never inspect pixel
+    # values, so there is no need for a float tensor and a 255x conversion.
+    return torch.randint(0, 256, (100, 100, 3), dtype=torch.uint8)
+
+
+@pytest.fixture(scope="module")
+def mock_pil_image(mock_image: torch.Tensor) -> Image.Image:
+    # Sharing one Image across tests is safe because Image.save only reads
+    # the source.
+    return Image.fromarray(mock_image.numpy())
+
+
+@pytest.fixture(scope="module")
+def images(mock_image: torch.Tensor) -> tuple[torch.Tensor, ...]:
+    # A shared single-image batch; a tuple since the tests never mutate it.
+    return (mock_image,)
+
+
+@pytest.fixture(scope="module")
+def save_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One directory for the whole save-image group; each test writes a
+    # uniquely named file into it, so the per-test mkdtemp/rmtree churn of
+    # function-scoped tmp_path is unnecessary.
+    return tmp_path_factory.mktemp("save_images")
+
+
+@pytest.fixture
+def stub_image_save(mocker: MockerFixture) -> MagicMock:
+    # The format tests only assert on the target path, so skip the real
+    # libjpeg/libpng/libwebp encoders and just touch the file.
+    return mocker.patch.object(
+        Image.Image,
+        "save",
+        autospec=True,
+        side_effect=lambda self, fp, *args, **kwargs: Path(fp).touch(),
+    )
+
+
+class _CallTracker:
+    """Minimal stand-in for MagicMock: counts calls and nothing else."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, *args: object, **kwargs: object) -> None:
+        self.calls += 1
+
+    def assert_called_once(self) -> None:
+        assert self.calls == 1
+
+
+@pytest.fixture
+def mock_save_image(
+    node: JHSaveImageWithXMPMetadataNode,
+) -> Generator[_CallTracker, None, None]:
+    tracker = _CallTracker()
+    node.save_image = tracker
+    yield tracker
+    del node.save_image  # Restore the real method on the shared node
+
+
+@pytest.mark.parametrize(
+    ("image_type", "suffix", "extra_kwargs"),
+    [
+        (JHSupportedImageTypes.JPEG, ".jpg", {}),
+        (JHSupportedImageTypes.PNG_WITH_WORKFLOW, ".png", {}),
+        (
+            JHSupportedImageTypes.PNG,
+            ".png",
+            {
+                "creator": "Test Creator",
+                "title": "Test Title",
+                "description": "Test Description",
+            },
+        ),
+    ],
+)
+def test_save_images(
+    node: JHSaveImageWithXMPMetadataNode,
+    images: tuple[torch.Tensor, ...],
+    mock_folder_paths: dict[str, MagicMock],
+    mock_save_image: _CallTracker,
+    image_type: JHSupportedImageTypes,
+    suffix: str,
+    extra_kwargs: dict,
+) -> None:
+    result = node.save_images(images, image_type=image_type, **extra_kwargs)
+
+    assert len(result["ui"]["images"]) == 1
+    assert result["ui"]["images"][0]["filename"].endswith(suffix)
+    mock_save_image.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("image_type", "suffix", "extra_kwargs"),
+    [
+        (JHSupportedImageTypes.JPEG, ".jpg", {}),
+        (JHSupportedImageTypes.PNG, ".png", {}),
+        (
+            JHSupportedImageTypes.PNG_WITH_WORKFLOW,
+            ".png",
+            {"prompt": "Test Prompt", "extra_pnginfo": {"workflow": "Test Workflow"}},
+        ),
+        (JHSupportedImageTypes.LOSSLESS_WEBP, ".webp", {}),
+        (JHSupportedImageTypes.WEBP, ".webp", {}),
+    ],
+)
+def test_save_image(
+    node: JHSaveImageWithXMPMetadataNode,
+    mock_pil_image: Image.Image,
+    stub_image_save: MagicMock,
+    save_dir: Path,
+    image_type: JHSupportedImageTypes,
+    suffix: str,
+    extra_kwargs: dict,
+) -> None:
+    to_path = save_dir / f"test_image_{image_type.name.lower()}{suffix}"
+    node.save_image(mock_pil_image, image_type, to_path, _XMP, **extra_kwargs)
+
+    assert to_path.exists()
+    assert to_path.suffix == suffix
+
+
+def test_save_image_real_encode(
+    node: JHSaveImageWithXMPMetadataNode, mock_pil_image: Image.Image, save_dir: Path
+) -> None:
+    # One smoke test that runs a real encoder end to end; the parametrized
+    # format tests above stub out Image.save.
+    to_path = save_dir / "test_image_real_encode.webp"
+
+    node.save_image(mock_pil_image, JHSupportedImageTypes.LOSSLESS_WEBP, to_path, _XMP)
+
+    assert to_path.exists()
+    assert to_path.stat().st_size > 0
+
+
+@pytest.mark.parametrize(
+    ("creator", "expected_xmp_calls"),
+    [("Test Creator", 1), (["Creator 1", "Creator 2", "Creator 3"], 3)],
+)
+def test_save_images_builds_shared_xmp_once(
+    node: JHSaveImageWithXMPMetadataNode,
+    mock_image: torch.Tensor,
+    mock_folder_paths: dict[str, MagicMock],
+    mock_save_image: _CallTracker,
+    mocker: MockerFixture,
+    creator: str | list,
+    expected_xmp_calls: int,
+) -> None:
+    # Scalar metadata yields one XMP document for the whole batch; list
+    # metadata still gets a per-image document.
+    xmp_spy = mocker.spy(node, "xmp")
+
+    node.save_images([mock_image] * 3, creator=creator)
+
+    assert xmp_spy.call_count == expected_xmp_calls
+    assert mock_save_image.calls == 3